@@ -0,0 +1,41 @@
+"""Cached conversion of pyairtable Formula objects to formula strings."""
+
+from functools import lru_cache
+
+from pyairtable.formulas import Formula, to_formula_str
+
+
+class _FormulaKey:
+    """
+    Hashes a Formula by its repr. pyairtable's Formula classes define
+    `__eq__` without `__hash__`, so they cannot be cache keys themselves,
+    but their repr spells out the whole expression tree.
+    """
+
+    __slots__ = ("formula", "key")
+
+    def __init__(self, formula: Formula) -> None:
+        self.formula = formula
+        self.key = repr(formula)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _FormulaKey) and other.key == self.key
+
+
+@lru_cache(maxsize=256)
+def _cached_formula_str(formula_key: _FormulaKey) -> str:
+    return to_formula_str(formula_key.formula)
+
+
+def formula_to_str(formula: Formula) -> str:
+    """
+    Converts a Formula to its string form, reusing the result for formulas
+    seen before (e.g. the same filter polled repeatedly). A plain Formula
+    already is its string, so only compound and comparison nodes are cached.
+    """
+    if type(formula) is Formula:
+        return str(formula)
+    return _cached_formula_str(_FormulaKey(formula))
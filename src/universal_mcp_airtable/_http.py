@@ -0,0 +1,143 @@
+"""HTTP helpers shared by the sync and async Airtable applications."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from http import HTTPStatus
+from itertools import islice
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from universal_mcp_airtable import _json
+
+# Airtable accepts at most this many records per batch write/delete request.
+MAX_RECORDS_PER_REQUEST = 10
+
+# Airtable allows 5 requests per second per base; `RATE_LIMITER` paces
+# requests to stay under it.
+REQUESTS_PER_SECOND = 5
+
+# Methods that can be resent after a 5xx or a dropped response without risking
+# a duplicate write.
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+
+def chunked(
+    items: Iterable[Any], size: int = MAX_RECORDS_PER_REQUEST
+) -> Iterator[list[Any]]:
+    """Splits `items` into lists of at most `size` items, e.g. one per batch request."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def base_id_from_path(path: str) -> str | None:
+    """Returns the base ID in an Airtable API path, or None for base-less paths."""
+    return next((part for part in path.split("/") if part.startswith("app")), None)
+
+
+class RateLimiter:
+    """
+    Token bucket per Airtable base, refilled at `rate` requests per second and
+    holding at most `rate` tokens. Thread-safe, so the sync thread pool and the
+    async event loop can draw from the same per-base budget.
+    """
+
+    def __init__(self, rate: float = REQUESTS_PER_SECOND) -> None:
+        self.rate = rate
+        self._lock = threading.Lock()
+        # base ID -> (tokens, monotonic time they were counted at)
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def reserve(self, base_id: str) -> float:
+        """
+        Takes a token for `base_id` and returns how many seconds to wait before
+        sending. Tokens go negative while requests are queued, so concurrent
+        callers are spaced out rather than released together.
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, counted_at = self._buckets.get(base_id, (self.rate, now))
+            tokens = min(self.rate, tokens + (now - counted_at) * self.rate) - 1
+            self._buckets[base_id] = (tokens, now)
+        return max(0.0, -tokens / self.rate)
+
+    def wait(self, base_id: str) -> None:
+        delay = self.reserve(base_id)
+        if delay:
+            time.sleep(delay)
+
+    async def async_wait(self, base_id: str) -> None:
+        delay = self.reserve(base_id)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+# Shared by every application in the process, since Airtable counts requests
+# per base regardless of which client sent them.
+RATE_LIMITER = RateLimiter()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that paces requests to each base through a `RateLimiter`."""
+
+    def __init__(self, rate_limiter: RateLimiter, **kwargs: Any) -> None:
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        base_id = base_id_from_path(urlsplit(request.url).path)
+        if base_id is not None:
+            self.rate_limiter.wait(base_id)
+        return super().send(request, **kwargs)
+
+
+class AirtableRetry(Retry):
+    """
+    Retry policy for the shared session.
+
+    5xx responses and read errors are only retried for idempotent methods
+    (`allowed_methods`): a POST or PATCH may already have been applied, and
+    resending it would create or update records twice. A 429 is retried for
+    every method, since Airtable rejects rate-limited requests unprocessed.
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def process_response(response: requests.Response | httpx.Response) -> Any:
+    """
+    Decodes an Airtable response from either requests or httpx.
+
+    Mirrors pyairtable's `Api._process_response`: Airtable's error payload is
+    appended to the raised HTTP error, and an empty body yields None.
+    """
+    try:
+        response.raise_for_status()
+    except (requests.exceptions.HTTPError, httpx.HTTPStatusError) as exc:
+        try:
+            error_dict = _json.loads(response.content)
+        except ValueError:
+            pass
+        else:
+            if isinstance(error_dict, dict) and "error" in error_dict:
+                exc.args = (*exc.args, repr(error_dict["error"]))
+        raise
+
+    # Some Airtable endpoints respond with an empty body and a 200.
+    if not response.content:
+        return None
+    return _json.loads(response.content)
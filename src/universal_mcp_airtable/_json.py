@@ -0,0 +1,54 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from typing import Any
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decodes a JSON document, preferring orjson over the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _orjson_response_hook(
+    response: requests.Response, *args: Any, **kwargs: Any
+) -> requests.Response:
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def install_orjson(session: requests.Session) -> None:
+    """
+    Routes a requests session's JSON request bodies and `response.json()`
+    through orjson. Does nothing when orjson is not installed.
+    """
+    if orjson is None:
+        return
+
+    session.hooks["response"].append(_orjson_response_hook)
+    prepare_request = session.prepare_request
+
+    def _prepare_request(request: requests.Request) -> requests.PreparedRequest:
+        if request.json is not None and not request.data:
+            try:
+                body = orjson.dumps(request.json)
+            except TypeError:
+                # Leave payloads orjson cannot encode to requests' own encoder.
+                return prepare_request(request)
+            request.data = body
+            request.json = None
+            request.headers = {
+                **(request.headers or {}),
+                "Content-Type": "application/json",
+            }
+        return prepare_request(request)
+
+    session.prepare_request = _prepare_request
@@ -1,9 +1,17 @@
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from itertools import chain, islice
 from typing import Any
+from urllib.parse import quote
+
+import requests
 
 # Import necessary components from pyairtable
 from pyairtable import Api
 from pyairtable.api.base import Base
+from pyairtable.api.params import options_to_params
 from pyairtable.api.table import Table
 from pyairtable.api.types import (
     RecordDeletedDict,
@@ -13,10 +21,39 @@ from pyairtable.api.types import (
     UpsertResultDict,
     WritableFields,
 )
-from pyairtable.formulas import Formula, to_formula_str
+from pyairtable.formulas import Formula
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
 
+from universal_mcp_airtable import _json
+from universal_mcp_airtable._formulas import formula_to_str
+from universal_mcp_airtable._http import (
+    IDEMPOTENT_METHODS,
+    RATE_LIMITER,
+    AirtableRetry,
+    RateLimitedAdapter,
+    chunked,
+    process_response,
+)
+from universal_mcp_airtable.errors import ErrorDict, error_to_dict
+
+AIRTABLE_API_URL = "https://api.airtable.com/v0"
+
+# Connection pool size for the shared session; requests' default of 10 makes
+# concurrent tool calls queue for a connection or open new ones.
+CONNECTION_POOL_SIZE = 64
+
+# How long (in seconds) base and table listings are served from the cache.
+SCHEMA_CACHE_TTL = 300
+
+# Credential keys an integration may store the Airtable API key under, in
+# order of preference.
+API_KEY_NAMES = ("api_key", "apiKey", "API_KEY")
+
+# How many batch requests are in flight at once. This bounds concurrency only;
+# the request rate per base is paced separately by `RATE_LIMITER`.
+BATCH_CONCURRENCY = 5
+
 
 class AirtableApp(APIApplication):
     """
@@ -25,17 +62,208 @@ class AirtableApp(APIApplication):
     """
 
     def __init__(self, integration: Integration | None = None) -> None:
+        self._api_key: str | None = None
+        self._api: Api | None = None
+        self._table_cache: dict[tuple[str, str], Table] = {}
+        self._schema_forbidden: set[str] = set()
+        self._schema_failed_at: dict[str, float] = {}
+        self._rate_limiter = RATE_LIMITER
+        self._meta_cache: dict[tuple[str, str | None], tuple[float, Any]] = {}
         super().__init__(name="airtable", integration=integration)
+        # Built once; list_tools() is called often by the server.
+        self._tools = (
+            self.list_bases,
+            self.list_tables,
+            self.invalidate_schema_cache,
+            self.get_record,
+            self.list_records,
+            self.create_record,
+            self.update_record,
+            self.delete_record,
+            self.batch_create_records,
+            self.batch_update_records,
+            self.batch_delete_records,
+            self.batch_upsert_records,
+        )
+
+    @property
+    def integration(self) -> Integration | None:
+        return self._integration
+
+    @integration.setter
+    def integration(self, value: Integration | None) -> None:
+        # A new integration may carry different credentials, so drop any
+        # client built from the old one.
+        self._integration = value
+        self.invalidate_client()
+
+    def invalidate_client(self) -> None:
+        """
+        Discards the cached API key, client, table handles and schema listings
+        so the next call re-reads credentials from the integration (e.g. after
+        key rotation).
+        """
+        self._api_key = None
+        self._api = None
+        self._table_cache = {}
+        self._schema_forbidden = set()
+        self._schema_failed_at = {}
+        self._meta_cache = {}
+
+    def _cached(
+        self, key: tuple[str, str | None], ttl: float, producer: Callable[[], Any]
+    ) -> Any:
+        """Returns the cached value for `key`, refreshing it once older than `ttl`."""
+        now = time.monotonic()
+        entry = self._meta_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = producer()
+        self._meta_cache[key] = (now, value)
+        return value
 
     def _get_client(self) -> Api:
-        """Initializes and returns the pyairtable client after ensuring API key is set."""
+        """
+        Returns the pyairtable client, creating it on first use.
+
+        The client is reused across calls so its HTTP session (and the
+        keep-alive connections it pools) survive between requests.
+        """
+        if self._api is not None:
+            return self._api
         if not self.integration:
              raise ValueError("Integration is not set for AirtableApp.")
-        credentials = self.integration.get_credentials()
-        api_key = credentials.get("api_key") or credentials.get("apiKey") or credentials.get("API_KEY")
-        if not api_key:
-            raise ValueError("Airtable API key is not configured in the integration.")
-        return Api(api_key)
+        if self._api_key is None:
+            credentials = self.integration.get_credentials()
+            api_key = next(
+                (credentials[k] for k in API_KEY_NAMES if credentials.get(k)), None
+            )
+            if not api_key:
+                raise ValueError("Airtable API key is not configured in the integration.")
+            self._api_key = api_key
+        self._api = Api(self._api_key)
+        session = self._api.session
+        session.mount("https://", RateLimitedAdapter(
+            self._rate_limiter,
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE,
+            max_retries=AirtableRetry(
+                total=5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                backoff_factor=0.5,
+                respect_retry_after_header=True,
+                allowed_methods=IDEMPOTENT_METHODS,
+            ),
+        ))
+        session.headers["Accept-Encoding"] = "gzip"
+        _json.install_orjson(session)
+        return self._api
+
+    def _tables(self, base_id: str) -> list[Table]:
+        """Returns the base's tables from the schema cache (see `_cached`)."""
+        base = self._get_client().base(base_id)
+        return self._cached(
+            ("tables", base_id), SCHEMA_CACHE_TTL, lambda: base.tables(force=True)
+        )
+
+    def _resolve_table_id(self, base_id: str, table_id_or_name: str) -> str:
+        """
+        Returns the table ID for a table name, looked up in the base's cached
+        table listing, so Airtable does not resolve the name on every request.
+        The lookup follows the listing's TTL, so renamed tables are picked up.
+        IDs, and names that cannot be resolved, are returned unchanged.
+        """
+        if table_id_or_name.startswith("tbl") or base_id in self._schema_forbidden:
+            return table_id_or_name
+        # A failed lookup has already gone through the session's retries; trying
+        # again on every call would stall each one for the full backoff.
+        failed_at = self._schema_failed_at.get(base_id)
+        if failed_at is not None and time.monotonic() - failed_at < SCHEMA_CACHE_TTL:
+            return table_id_or_name
+        try:
+            tables = self._tables(base_id)
+        except requests.exceptions.RequestException as e:
+            # Without schema access the lookup will never succeed, so stop
+            # trying; other failures may be transient and are retried once the
+            # schema TTL has passed.
+            response = getattr(e, "response", None)
+            if response is not None and response.status_code == HTTPStatus.FORBIDDEN:
+                self._schema_forbidden.add(base_id)
+            else:
+                self._schema_failed_at[base_id] = time.monotonic()
+            return table_id_or_name
+        self._schema_failed_at.pop(base_id, None)
+        matches = (t.id for t in tables if t.name == table_id_or_name)
+        return next(matches, table_id_or_name)
+
+    def _get_table(self, base_id: str, table_id_or_name: str) -> Table:
+        """Returns a cached pyairtable Table handle for the given base and table."""
+        key = (base_id, self._resolve_table_id(base_id, table_id_or_name))
+        table = self._table_cache.get(key)
+        if table is None:
+            table = self._get_client().table(*key)
+            self._table_cache[key] = table
+        return table
+
+    def _record_url(
+        self, base_id: str, table_id_or_name: str, record_id: RecordId
+    ) -> str:
+        table_id = self._resolve_table_id(base_id, table_id_or_name)
+        return f"{AIRTABLE_API_URL}/{base_id}/{quote(table_id, safe='')}/{record_id}"
+
+    def _raw_request(self, method: str, url: str, **params: Any) -> Any:
+        """
+        Sends a request through the shared client session and decodes the JSON
+        body directly, skipping pyairtable's Table layer. The session carries
+        the auth header and the retrying connection pool.
+
+        The response is decoded by `process_response`, which keeps Airtable's
+        error payload on raised errors and returns None for an empty body.
+        """
+        client = self._get_client()
+        response = client.session.request(
+            method, url, params=params or None, timeout=client.timeout
+        )
+        return process_response(response)
+
+    def _raw_get(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        record_id: RecordId,
+        **options: Any
+    ) -> RecordDict:
+        url = self._record_url(base_id, table_id_or_name, record_id)
+        return self._raw_request("GET", url, **options_to_params(options))
+
+    def _raw_delete(
+        self, base_id: str, table_id_or_name: str, record_id: RecordId
+    ) -> RecordDeletedDict:
+        url = self._record_url(base_id, table_id_or_name, record_id)
+        return self._raw_request("DELETE", url)
+
+    def _batch_concurrent(
+        self,
+        table: Table,
+        op: str,
+        records: Iterable[Any],
+        concurrency: int = BATCH_CONCURRENCY,
+        **options: Any
+    ) -> list[Any]:
+        """
+        Runs a pyairtable batch operation (e.g. "batch_create") over `records`,
+        sending the per-request chunks concurrently instead of one after another.
+
+        Results are returned in input order. The shared session's adapter paces
+        the requests to the base's rate limit and retries 429 responses.
+        """
+        method = getattr(table, op)
+        chunks = list(chunked(records))
+        if len(chunks) <= 1:
+            return list(chain.from_iterable(method(c, **options) for c in chunks))
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+            results = executor.map(lambda chunk: method(chunk, **options), chunks)
+            return list(chain.from_iterable(results))
 
     def _prepare_pyairtable_params(self, collected_options: dict[str, Any]) -> dict[str, Any]:
         """
@@ -51,24 +279,27 @@ class AirtableApp(APIApplication):
         return collected_options
 
 
-    def list_bases(self) -> list[Base] | str:
+    def list_bases(self) -> list[Base] | ErrorDict:
         """
         Lists all bases accessible with the current API key.
 
         Returns:
             A list of pyairtable.api.base.Base objects on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             list, base, important
         """
         try:
             client = self._get_client()
-            return client.bases()
+            # force=True bypasses pyairtable's own (unbounded) cache once ours expires.
+            return self._cached(
+                ("bases", None), SCHEMA_CACHE_TTL, lambda: client.bases(force=True)
+            )
         except Exception as e:
-            return f"Error listing bases: {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
-    def list_tables(self, base_id: str) -> list[Table] | str:
+    def list_tables(self, base_id: str) -> list[Table] | ErrorDict:
         """
         Lists all tables within a specified base.
 
@@ -77,17 +308,30 @@ class AirtableApp(APIApplication):
 
         Returns:
             A list of pyairtable.api.table.Table objects on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             list, table, important
         """
         try:
-            client = self._get_client()
-            base = client.base(base_id)
-            return base.tables()
+            return self._tables(base_id)
         except Exception as e:
-            return f"Error listing tables for base '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
+
+    def invalidate_schema_cache(self) -> None:
+        """
+        Clears cached base and table listings so the next `list_bases` or
+        `list_tables` call fetches fresh metadata, e.g. after a table is created.
+
+        Returns:
+            None.
+
+        Tags:
+            base, table, cache
+        """
+        self._meta_cache = {}
+        self._schema_forbidden = set()
+        self._schema_failed_at = {}
 
     def get_record(
         self,
@@ -95,7 +339,7 @@ class AirtableApp(APIApplication):
         table_id_or_name: str,
         record_id: RecordId,
         **options: Any
-    ) -> RecordDict | str:
+    ) -> RecordDict | ErrorDict:
         """
         Retrieves a single record by its ID from a specified table within a base.
 
@@ -109,25 +353,25 @@ class AirtableApp(APIApplication):
 
         Returns:
             A dictionary representing the record on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             get, record, important
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
             pyairtable_params = self._prepare_pyairtable_params(options)
-            return table.get(record_id, **pyairtable_params)
+            return self._raw_get(
+                base_id, table_id_or_name, record_id, **pyairtable_params
+            )
         except Exception as e:
-            return f"Error getting record '{record_id}' from '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
     def list_records(
         self,
         base_id: str,
         table_id_or_name: str,
         **options: Any
-    ) -> list[RecordDict] | str:
+    ) -> list[RecordDict] | ErrorDict:
         """
         Lists records from a specified table within a base.
 
@@ -141,23 +385,64 @@ class AirtableApp(APIApplication):
 
         Returns:
             A list of dictionaries, where each dictionary represents a record, on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             list, record, important
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
-            pyairtable_params = self._prepare_pyairtable_params(options)
+            pyairtable_params = dict(self._prepare_pyairtable_params(options))
+            max_records = pyairtable_params.pop('max_records', None)
+            if max_records is None:
+                records = self.iter_records(
+                    base_id, table_id_or_name, **pyairtable_params
+                )
+                return list(records)
+
+            # Stop requesting pages as soon as the cap is met rather than
+            # fetching every page and truncating afterwards.
+            page_size = pyairtable_params.get('page_size', 100)
+            pyairtable_params['page_size'] = max(1, min(page_size, max_records))
+            records = self.iter_records(base_id, table_id_or_name, **pyairtable_params)
+            return list(islice(records, max_records))
+        except Exception as e:
+            return error_to_dict(e)
+
+    def iter_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        **options: Any
+    ) -> Iterator[RecordDict]:
+        """
+        Iterates over records from a specified table within a base, fetching one page at a time.
 
-            # Convert Formula object to string if provided, after preparing params
-            if 'formula' in pyairtable_params and isinstance(pyairtable_params['formula'], Formula):
-                 pyairtable_params['formula'] = to_formula_str(pyairtable_params['formula'])
+        Unlike `list_records`, records are yielded as each page arrives, so the full
+        result set is never held in memory and no further pages are requested once
+        the caller stops iterating. This is a Python API only and is not exposed as
+        a tool, since a generator cannot be returned as an MCP result.
 
-            return table.all(**pyairtable_params)
-        except Exception as e:
-            return f"Error listing records from '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+        Args:
+            base_id: The ID of the base.
+            table_id_or_name: The ID or name of the table.
+            **options: Additional options for listing records (e.g., view, page_size, formula, sort).
+                       Formula can be a string or a pyairtable.formulas.Formula object.
+                       If these are passed within a nested "options" dict from a tool call,
+                       they will be extracted.
+
+        Returns:
+            An iterator of dictionaries, where each dictionary represents a record.
+            Errors are raised rather than returned.
+        """
+        table = self._get_table(base_id, table_id_or_name)
+        pyairtable_params = dict(self._prepare_pyairtable_params(options))
+        pyairtable_params.setdefault('page_size', 100)
+
+        if 'formula' in pyairtable_params and isinstance(pyairtable_params['formula'], Formula):
+             pyairtable_params['formula'] = formula_to_str(pyairtable_params['formula'])
+
+        for page in table.iterate(**pyairtable_params):
+            yield from page
 
     def create_record(
         self,
@@ -165,7 +450,7 @@ class AirtableApp(APIApplication):
         table_id_or_name: str,
         fields: WritableFields,
         **options: Any # Captures typecast, use_field_ids etc.
-    ) -> RecordDict | str:
+    ) -> RecordDict | ErrorDict:
         """
         Creates a new record in a specified table within a base.
 
@@ -179,14 +464,13 @@ class AirtableApp(APIApplication):
 
         Returns:
             A dictionary representing the newly created record on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             create, record, important
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
+            table = self._get_table(base_id, table_id_or_name)
             # pyairtable's Table.create() takes typecast and use_field_ids as named args,
             # not as **kwargs. We need to extract them or use defaults.
 
@@ -212,7 +496,7 @@ class AirtableApp(APIApplication):
 
             return table.create(fields=fields, **call_kwargs)
         except Exception as e:
-            return f"Error creating record in '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
     def update_record(
         self,
@@ -221,7 +505,7 @@ class AirtableApp(APIApplication):
         record_id: RecordId,
         fields: WritableFields,
         **options: Any # Captures replace, typecast, use_field_ids etc.
-    ) -> RecordDict | str:
+    ) -> RecordDict | ErrorDict:
         """
         Updates an existing record in a specified table within a base.
 
@@ -236,14 +520,13 @@ class AirtableApp(APIApplication):
 
         Returns:
             A dictionary representing the updated record on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             update, record
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
+            table = self._get_table(base_id, table_id_or_name)
             # pyairtable.Table.update() signature:
             # update(self, record_id: RecordId, fields: WritableFields, replace: bool = False,
             #        typecast: bool = False, use_field_ids: Optional[bool] = None)
@@ -260,14 +543,14 @@ class AirtableApp(APIApplication):
 
             return table.update(record_id, fields=fields, **call_kwargs)
         except Exception as e:
-            return f"Error updating record '{record_id}' in '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
     def delete_record(
         self,
         base_id: str,
         table_id_or_name: str,
         record_id: RecordId
-    ) -> RecordDeletedDict | str:
+    ) -> RecordDeletedDict | ErrorDict:
         """
         Deletes a record from a specified table within a base.
 
@@ -278,17 +561,15 @@ class AirtableApp(APIApplication):
 
         Returns:
             A dictionary confirming the deletion on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             delete, record
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
-            return table.delete(record_id)
+            return self._raw_delete(base_id, table_id_or_name, record_id)
         except Exception as e:
-            return f"Error deleting record '{record_id}' from '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
     def batch_create_records(
         self,
@@ -296,7 +577,7 @@ class AirtableApp(APIApplication):
         table_id_or_name: str,
         records: Iterable[WritableFields],
         **options: Any # Captures typecast, use_field_ids etc.
-    ) -> list[RecordDict] | str:
+    ) -> list[RecordDict] | ErrorDict:
         """
         Creates multiple records in batches in a specified table.
 
@@ -310,14 +591,16 @@ class AirtableApp(APIApplication):
 
         Returns:
             A list of dictionaries representing the newly created records on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             create, record, batch
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
+            records = list(records)
+            if not records:
+                return []
+            table = self._get_table(base_id, table_id_or_name)
             # pyairtable.Table.batch_create() signature:
             # batch_create(self, records: Iterable[WritableFields], typecast: bool = False, use_field_ids: Optional[bool] = None)
             # It does NOT take a general **kwargs.
@@ -329,9 +612,9 @@ class AirtableApp(APIApplication):
             if 'use_field_ids' in prepared_options:
                 call_kwargs['use_field_ids'] = prepared_options['use_field_ids']
 
-            return table.batch_create(records, **call_kwargs)
+            return self._batch_concurrent(table, 'batch_create', records, **call_kwargs)
         except Exception as e:
-            return f"Error batch creating records in '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
     def batch_update_records(
         self,
@@ -339,7 +622,7 @@ class AirtableApp(APIApplication):
         table_id_or_name: str,
         records: Iterable[UpdateRecordDict],
         **options: Any # Captures replace, typecast, use_field_ids etc.
-    ) -> list[RecordDict] | str:
+    ) -> list[RecordDict] | ErrorDict:
         """
         Updates multiple records in batches in a specified table.
 
@@ -353,14 +636,16 @@ class AirtableApp(APIApplication):
 
         Returns:
             A list of dictionaries representing the updated records on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             update, record, batch
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
+            records = list(records)
+            if not records:
+                return []
+            table = self._get_table(base_id, table_id_or_name)
             # pyairtable.Table.batch_update() signature:
             # batch_update(self, records: Iterable[UpdateRecordDict], replace: bool = False,
             #              typecast: bool = False, use_field_ids: Optional[bool] = None)
@@ -375,16 +660,16 @@ class AirtableApp(APIApplication):
             if 'use_field_ids' in prepared_options:
                 call_kwargs['use_field_ids'] = prepared_options['use_field_ids']
 
-            return table.batch_update(records, **call_kwargs)
+            return self._batch_concurrent(table, 'batch_update', records, **call_kwargs)
         except Exception as e:
-            return f"Error batch updating records in '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
     def batch_delete_records(
         self,
         base_id: str,
         table_id_or_name: str,
         record_ids: Iterable[RecordId]
-    ) -> list[RecordDeletedDict] | str:
+    ) -> list[RecordDeletedDict] | ErrorDict:
         """
         Deletes multiple records in batches from a specified table.
 
@@ -395,17 +680,19 @@ class AirtableApp(APIApplication):
 
         Returns:
             A list of dictionaries confirming the deletion status for each record on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             delete, record, batch
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
-            return table.batch_delete(record_ids)
+            record_ids = list(record_ids)
+            if not record_ids:
+                return []
+            table = self._get_table(base_id, table_id_or_name)
+            return self._batch_concurrent(table, 'batch_delete', record_ids)
         except Exception as e:
-            return f"Error batch deleting records from '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
     def batch_upsert_records(
         self,
@@ -414,7 +701,7 @@ class AirtableApp(APIApplication):
         records: Iterable[dict[str, Any]], # pyairtable expects Dict, not UpdateRecordDict here
         key_fields: list[str],
         **options: Any # Captures replace, typecast, use_field_ids etc.
-    ) -> UpsertResultDict | str:
+    ) -> UpsertResultDict | ErrorDict:
         """
         Updates or creates records in batches in a specified table.
 
@@ -432,14 +719,16 @@ class AirtableApp(APIApplication):
 
         Returns:
             A dictionary containing lists of created/updated record IDs and the affected records on success,
-            or a string containing an error message on failure.
+            or an error dictionary (see `ErrorDict`) on failure.
 
         Tags:
             create, update, record, batch, upsert
         """
         try:
-            client = self._get_client()
-            table = client.table(base_id, table_id_or_name)
+            records = list(records)
+            if not records:
+                return {"createdRecords": [], "updatedRecords": [], "records": []}
+            table = self._get_table(base_id, table_id_or_name)
             # pyairtable.Table.batch_upsert() signature:
             # batch_upsert(self, records: Iterable[Dict[str, Any]], key_fields: List[FieldName],
             #              replace: bool = False, typecast: bool = False, use_field_ids: Optional[bool] = None)
@@ -456,20 +745,8 @@ class AirtableApp(APIApplication):
 
             return table.batch_upsert(records, key_fields=key_fields, **call_kwargs)
         except Exception as e:
-            return f"Error batch upserting records in '{table_id_or_name}' in '{base_id}': {type(e).__name__} - {e}"
+            return error_to_dict(e)
 
     def list_tools(self):
         """Returns a list of methods exposed as tools."""
-        return [
-            self.list_bases,
-            self.list_tables,
-            self.get_record,
-            self.list_records,
-            self.create_record,
-            self.update_record,
-            self.delete_record,
-            self.batch_create_records,
-            self.batch_update_records,
-            self.batch_delete_records,
-            self.batch_upsert_records,
-        ]
+        return list(self._tools)
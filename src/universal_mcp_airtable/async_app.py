@@ -0,0 +1,412 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+from urllib.parse import quote
+
+import httpx
+from pyairtable.api.params import options_to_json_and_params, options_to_params
+from pyairtable.api.types import (
+    RecordDeletedDict,
+    RecordDict,
+    RecordId,
+    UpdateRecordDict,
+    UpsertResultDict,
+    WritableFields,
+)
+from pyairtable.formulas import Formula
+from universal_mcp.applications import APIApplication
+from universal_mcp.integrations import Integration
+
+from universal_mcp_airtable._formulas import formula_to_str
+from universal_mcp_airtable._http import (
+    RATE_LIMITER,
+    base_id_from_path,
+    chunked,
+    process_response,
+)
+from universal_mcp_airtable.app import (
+    AIRTABLE_API_URL,
+    API_KEY_NAMES,
+    BATCH_CONCURRENCY,
+    AirtableApp,
+)
+from universal_mcp_airtable.errors import ErrorDict, error_to_dict
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+TOO_MANY_REQUESTS = 429
+
+# Retry budget for requests rejected with 429 Too Many Requests.
+MAX_RATE_LIMIT_RETRIES = 5
+
+
+def _doc_from(tool: Callable[..., Any]) -> Callable[[_F], _F]:
+    """Reuses the docstring of the AirtableApp tool with the same contract."""
+
+    def decorate(fn: _F) -> _F:
+        fn.__doc__ = tool.__doc__
+        return fn
+
+    return decorate
+
+
+class AirtableAppAsync(APIApplication):
+    """
+    Asynchronous variant of AirtableApp. All tools are coroutines issuing
+    requests through a single long-lived httpx.AsyncClient, so concurrent
+    tool calls share one connection pool instead of blocking a worker each.
+    Call `aclose()` on shutdown to release the pooled connections.
+    """
+
+    def __init__(self, integration: Integration | None = None) -> None:
+        super().__init__(name="airtable", integration=integration)
+        # Built once; list_tools() is called often by the server.
+        self._tools = (
+            self.list_bases,
+            self.list_tables,
+            self.gather_list_tables,
+            self.get_record,
+            self.list_records,
+            self.create_record,
+            self.update_record,
+            self.delete_record,
+            self.batch_create_records,
+            self.batch_update_records,
+            self.batch_delete_records,
+            self.batch_upsert_records,
+        )
+        self._client: httpx.AsyncClient | None = None
+        self._rate_limiter = RATE_LIMITER
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Returns the shared httpx client, creating it on first use."""
+        if self._client is not None:
+            return self._client
+        if not self.integration:
+            raise ValueError("Integration is not set for AirtableAppAsync.")
+        credentials = self.integration.get_credentials()
+        api_key = next(
+            (credentials[k] for k in API_KEY_NAMES if credentials.get(k)), None
+        )
+        if not api_key:
+            raise ValueError("Airtable API key is not configured in the integration.")
+        self._client = httpx.AsyncClient(
+            base_url=AIRTABLE_API_URL,
+            headers={"Authorization": f"Bearer {api_key}"},
+            limits=httpx.Limits(max_keepalive_connections=32),
+            timeout=self.default_timeout,
+        )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the shared HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    _prepare_pyairtable_params = AirtableApp._prepare_pyairtable_params
+
+    @staticmethod
+    def _table_path(base_id: str, table_id_or_name: str) -> str:
+        return f"/{base_id}/{quote(table_id_or_name, safe='')}"
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Any = None,
+        json: Any = None,
+    ) -> Any:
+        client = self._get_client()
+        base_id = base_id_from_path(path)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            if base_id is not None:
+                await self._rate_limiter.async_wait(base_id)
+            response = await client.request(method, path, params=params, json=json)
+            if (
+                response.status_code != TOO_MANY_REQUESTS
+                or attempt == MAX_RATE_LIMIT_RETRIES
+            ):
+                break
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                await asyncio.sleep(float(retry_after))
+            else:
+                await asyncio.sleep(0.5 * 2**attempt)
+        return process_response(response)
+
+    async def _batch_concurrent(
+        self,
+        method: str,
+        path: str,
+        requests: list[dict[str, Any]],
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> list[Any]:
+        """
+        Sends one request per entry of `requests` (each holding the `json` or
+        `params` for `_request`) with at most `concurrency` in flight, and
+        returns the decoded responses in input order. `_request` paces each
+        one to the base's rate limit.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(request_kwargs: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self._request(method, path, **request_kwargs)
+
+        return await asyncio.gather(*(send(kwargs) for kwargs in requests))
+
+    @staticmethod
+    def _write_body(prepared_options: dict[str, Any]) -> dict[str, Any]:
+        """Maps the write options accepted by the tools onto the JSON body keys."""
+        body: dict[str, Any] = {}
+        if prepared_options.get("typecast"):
+            body["typecast"] = True
+        if prepared_options.get("use_field_ids") is not None:
+            body["returnFieldsByFieldId"] = bool(prepared_options["use_field_ids"])
+        return body
+
+    async def list_bases(self) -> list[dict[str, Any]] | ErrorDict:
+        """
+        Lists all bases accessible with the current API key.
+
+        Returns:
+            A list of dictionaries describing each base on success,
+            or an error dictionary (see `ErrorDict`) on failure.
+
+        Tags:
+            list, base, important
+        """
+        try:
+            bases: list[dict[str, Any]] = []
+            params: dict[str, Any] = {}
+            while True:
+                data = await self._request("GET", "/meta/bases", params=params)
+                bases.extend(data.get("bases", []))
+                if not data.get("offset"):
+                    return bases
+                params["offset"] = data["offset"]
+        except Exception as e:
+            return error_to_dict(e)
+
+    async def list_tables(self, base_id: str) -> list[dict[str, Any]] | ErrorDict:
+        """
+        Lists all tables within a specified base.
+
+        Args:
+            base_id: The ID of the base.
+
+        Returns:
+            A list of dictionaries describing each table's schema on success,
+            or an error dictionary (see `ErrorDict`) on failure.
+
+        Tags:
+            list, table, important
+        """
+        try:
+            data = await self._request("GET", f"/meta/bases/{base_id}/tables")
+            return data.get("tables", [])
+        except Exception as e:
+            return error_to_dict(e)
+
+    async def gather_list_tables(
+        self, base_ids: list[str]
+    ) -> dict[str, list[dict[str, Any]] | ErrorDict]:
+        """
+        Lists the tables of several bases concurrently.
+
+        Args:
+            base_ids: The IDs of the bases to inspect.
+
+        Returns:
+            A dictionary mapping each base ID to its list of tables, or to
+            an error dictionary if listing that base failed.
+
+        Tags:
+            list, table, batch
+        """
+        results = await asyncio.gather(*(self.list_tables(b) for b in base_ids))
+        return dict(zip(base_ids, results, strict=True))
+
+    @_doc_from(AirtableApp.get_record)
+    async def get_record(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        record_id: RecordId,
+        **options: Any
+    ) -> RecordDict | ErrorDict:
+        try:
+            params = options_to_params(self._prepare_pyairtable_params(options))
+            path = f"{self._table_path(base_id, table_id_or_name)}/{record_id}"
+            return await self._request("GET", path, params=params)
+        except Exception as e:
+            return error_to_dict(e)
+
+    @_doc_from(AirtableApp.list_records)
+    async def list_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        **options: Any
+    ) -> list[RecordDict] | ErrorDict:
+        try:
+            pyairtable_params = dict(self._prepare_pyairtable_params(options))
+            formula = pyairtable_params.get('formula')
+            if isinstance(formula, Formula):
+                pyairtable_params['formula'] = formula_to_str(formula)
+
+            # Listing via POST keeps long formulas out of the URL.
+            body, params = options_to_json_and_params(pyairtable_params)
+            path = f"{self._table_path(base_id, table_id_or_name)}/listRecords"
+            records: list[RecordDict] = []
+            while True:
+                data = await self._request("POST", path, params=params, json=body)
+                records.extend(data.get("records", []))
+                if not data.get("offset"):
+                    return records
+                body["offset"] = data["offset"]
+        except Exception as e:
+            return error_to_dict(e)
+
+    @_doc_from(AirtableApp.create_record)
+    async def create_record(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        fields: WritableFields,
+        **options: Any
+    ) -> RecordDict | ErrorDict:
+        try:
+            body = self._write_body(self._prepare_pyairtable_params(options))
+            body["fields"] = fields
+            path = self._table_path(base_id, table_id_or_name)
+            return await self._request("POST", path, json=body)
+        except Exception as e:
+            return error_to_dict(e)
+
+    @_doc_from(AirtableApp.update_record)
+    async def update_record(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        record_id: RecordId,
+        fields: WritableFields,
+        **options: Any
+    ) -> RecordDict | ErrorDict:
+        try:
+            prepared_options = self._prepare_pyairtable_params(options)
+            body = self._write_body(prepared_options)
+            body["fields"] = fields
+            method = "PUT" if prepared_options.get("replace") else "PATCH"
+            path = f"{self._table_path(base_id, table_id_or_name)}/{record_id}"
+            return await self._request(method, path, json=body)
+        except Exception as e:
+            return error_to_dict(e)
+
+    @_doc_from(AirtableApp.delete_record)
+    async def delete_record(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        record_id: RecordId
+    ) -> RecordDeletedDict | ErrorDict:
+        try:
+            path = f"{self._table_path(base_id, table_id_or_name)}/{record_id}"
+            return await self._request("DELETE", path)
+        except Exception as e:
+            return error_to_dict(e)
+
+    @_doc_from(AirtableApp.batch_create_records)
+    async def batch_create_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        records: Iterable[WritableFields],
+        **options: Any
+    ) -> list[RecordDict] | ErrorDict:
+        try:
+            base_body = self._write_body(self._prepare_pyairtable_params(options))
+            path = self._table_path(base_id, table_id_or_name)
+            requests = [
+                {"json": {**base_body, "records": [{"fields": f} for f in chunk]}}
+                for chunk in chunked(records)
+            ]
+            responses = await self._batch_concurrent("POST", path, requests)
+            return [record for data in responses for record in data["records"]]
+        except Exception as e:
+            return error_to_dict(e)
+
+    @_doc_from(AirtableApp.batch_update_records)
+    async def batch_update_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        records: Iterable[UpdateRecordDict],
+        **options: Any
+    ) -> list[RecordDict] | ErrorDict:
+        try:
+            prepared_options = self._prepare_pyairtable_params(options)
+            base_body = self._write_body(prepared_options)
+            method = "PUT" if prepared_options.get("replace") else "PATCH"
+            path = self._table_path(base_id, table_id_or_name)
+            updates = [{"id": r["id"], "fields": r["fields"]} for r in records]
+            requests = [
+                {"json": {**base_body, "records": chunk}} for chunk in chunked(updates)
+            ]
+            responses = await self._batch_concurrent(method, path, requests)
+            return [record for data in responses for record in data["records"]]
+        except Exception as e:
+            return error_to_dict(e)
+
+    @_doc_from(AirtableApp.batch_delete_records)
+    async def batch_delete_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        record_ids: Iterable[RecordId]
+    ) -> list[RecordDeletedDict] | ErrorDict:
+        try:
+            path = self._table_path(base_id, table_id_or_name)
+            requests = [
+                {"params": [("records[]", rid) for rid in chunk]}
+                for chunk in chunked(record_ids)
+            ]
+            responses = await self._batch_concurrent("DELETE", path, requests)
+            return [record for data in responses for record in data["records"]]
+        except Exception as e:
+            return error_to_dict(e)
+
+    @_doc_from(AirtableApp.batch_upsert_records)
+    async def batch_upsert_records(
+        self,
+        base_id: str,
+        table_id_or_name: str,
+        records: Iterable[dict[str, Any]],
+        key_fields: list[str],
+        **options: Any
+    ) -> UpsertResultDict | ErrorDict:
+        try:
+            prepared_options = self._prepare_pyairtable_params(options)
+            base_body = self._write_body(prepared_options)
+            base_body["performUpsert"] = {"fieldsToMergeOn": key_fields}
+            method = "PUT" if prepared_options.get("replace") else "PATCH"
+            path = self._table_path(base_id, table_id_or_name)
+            result: UpsertResultDict = {
+                "createdRecords": [],
+                "updatedRecords": [],
+                "records": [],
+            }
+            for chunk in chunked(records):
+                body = {**base_body, "records": chunk}
+                data = await self._request(method, path, json=body)
+                result["createdRecords"].extend(data["createdRecords"])
+                result["updatedRecords"].extend(data["updatedRecords"])
+                result["records"].extend(data["records"])
+            return result
+        except Exception as e:
+            return error_to_dict(e)
+
+    def list_tools(self):
+        """Returns a list of methods exposed as tools."""
+        return list(self._tools)
@@ -0,0 +1,52 @@
+from typing import TypedDict
+
+import httpx
+import requests
+
+
+class ErrorDetail(TypedDict):
+    kind: str
+    status: int | None
+    message: str
+
+
+class ErrorDict(TypedDict):
+    """Returned by the Airtable tools in place of a result when a call fails."""
+
+    error: ErrorDetail
+
+
+# Statuses at or above this are reported as server errors.
+SERVER_ERROR_STATUS = 500
+
+_KIND_BY_STATUS = {
+    401: "unauthorized",
+    403: "forbidden",
+    404: "not_found",
+    422: "invalid_request",
+    429: "rate_limited",
+}
+
+
+def _kind_for_status(status: int) -> str:
+    if status >= SERVER_ERROR_STATUS:
+        return "server_error"
+    return _KIND_BY_STATUS.get(status, "http_error")
+
+
+def error_to_dict(e: Exception) -> ErrorDict:
+    """
+    Classifies an exception raised by a tool call, so callers can branch on
+    `kind`/`status` instead of parsing the message.
+    """
+    status: int | None = None
+    if isinstance(e, requests.exceptions.RetryError):
+        kind = "retries_exhausted"
+    elif isinstance(e, requests.HTTPError | httpx.HTTPStatusError) and (
+        e.response is not None
+    ):
+        status = e.response.status_code
+        kind = _kind_for_status(status)
+    else:
+        kind = "error"
+    return {"error": {"kind": kind, "status": status, "message": str(e)}}
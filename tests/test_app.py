@@ -1,11 +1,18 @@
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import MagicMock
 
 import pytest
+import requests
+from pyairtable.formulas import AND, EQ, GT, Field, Formula, to_formula_str
 from universal_mcp.utils.testing import (
     check_application_instance,
 )
+from urllib3.exceptions import ReadTimeoutError
 
-from universal_mcp_airtable.app import AirtableApp
+from universal_mcp_airtable._formulas import _cached_formula_str, formula_to_str
+from universal_mcp_airtable.app import SCHEMA_CACHE_TTL, AirtableApp
 
 @pytest.fixture
 def app_instance():
@@ -15,3 +22,331 @@ def app_instance():
 
 def test_application(app_instance):
     check_application_instance(app_instance, app_name="airtable")
+
+def test_client_is_reused_until_integration_changes():
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"api_key": "dummy_api_key"}
+    app = AirtableApp(integration=mock_integration)
+
+    client = app._get_client()
+    assert app._get_client() is client
+    table = app._get_table("appBase", "tblTable")
+    assert app._get_table("appBase", "tblTable") is table
+
+    app.integration = mock_integration
+    assert app._get_client() is not client
+
+
+def test_invalidate_client_rereads_credentials():
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"apiKey": "old_key"}
+    app = AirtableApp(integration=mock_integration)
+    app._get_client()
+    app._get_client()
+    mock_integration.get_credentials.assert_called_once()
+
+    mock_integration.get_credentials.reset_mock()
+    mock_integration.get_credentials.return_value = {"apiKey": "new_key"}
+    app.invalidate_client()
+    app._get_client()
+    mock_integration.get_credentials.assert_called_once()
+    assert app._api_key == "new_key"
+
+def test_batch_concurrent_preserves_input_order(app_instance):
+    record_count = 35
+    table = MagicMock()
+    table.batch_create.side_effect = lambda chunk, **_: [{"id": f["n"]} for f in chunk]
+    records = [{"n": i} for i in range(record_count)]
+
+    result = app_instance._batch_concurrent(
+        table, "batch_create", records, typecast=True
+    )
+
+    assert [r["id"] for r in result] == list(range(record_count))
+    calls = table.batch_create.call_args_list
+    assert [len(call.args[0]) for call in calls] == [10, 10, 10, 5]
+    assert all(call.kwargs == {"typecast": True} for call in calls)
+
+def test_get_record_uses_shared_session(app_instance):
+    client = MagicMock()
+    client.session.request.return_value.content = b'{"id": "rec1", "fields": {}}'
+    app_instance._api = client
+
+    result = app_instance.get_record(
+        "appBase", "tblTable", "rec1", cell_format="string"
+    )
+
+    assert result == {"id": "rec1", "fields": {}}
+    method, url = client.session.request.call_args.args
+    assert method == "GET"
+    assert url == "https://api.airtable.com/v0/appBase/tblTable/rec1"
+
+def test_empty_batches_skip_client_setup(app_instance):
+    assert app_instance.batch_create_records("appBase", "tblTable", iter([])) == []
+    assert app_instance.batch_update_records("appBase", "tblTable", []) == []
+    assert app_instance.batch_delete_records("appBase", "tblTable", ()) == []
+    upserted = app_instance.batch_upsert_records(
+        "appBase", "tblTable", [], key_fields=["Name"]
+    )
+    assert upserted == {"createdRecords": [], "updatedRecords": [], "records": []}
+    app_instance.integration.get_credentials.assert_not_called()
+
+def test_errors_are_returned_as_structured_dicts(app_instance):
+    status = 404
+    response = requests.Response()
+    response.status_code = status
+    client = MagicMock()
+    client.session.request.return_value = response
+    app_instance._api = client
+
+    result = app_instance.get_record("appBase", "tblTable", "recMissing")
+
+    assert result["error"]["kind"] == "not_found"
+    assert result["error"]["status"] == status
+
+def test_list_tables_is_cached_until_invalidated(app_instance):
+    client = MagicMock()
+    app_instance._api = client
+
+    first = app_instance.list_tables("appBase")
+    assert app_instance.list_tables("appBase") is first
+    assert client.base.return_value.tables.call_count == 1
+
+    tables = client.base.return_value.tables
+    tables.reset_mock()
+    app_instance.invalidate_schema_cache()
+    app_instance.list_tables("appBase")
+    tables.assert_called_once_with(force=True)
+
+def make_table(table_id, name):
+    table = MagicMock(id=table_id)
+    table.name = name
+    return table
+
+
+def test_table_names_are_resolved_to_ids(app_instance):
+    client = MagicMock()
+    tables = client.base.return_value.tables
+    tables.return_value = [make_table("tblProjects", "Projects")]
+    app_instance._api = client
+
+    assert app_instance._resolve_table_id("appBase", "Projects") == "tblProjects"
+    assert app_instance._resolve_table_id("appBase", "Projects") == "tblProjects"
+    assert app_instance._resolve_table_id("appBase", "Unknown") == "Unknown"
+    assert app_instance._resolve_table_id("appBase", "tblOther") == "tblOther"
+    tables.assert_called_once()
+
+
+def test_table_name_resolution_follows_schema_ttl(app_instance, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("universal_mcp_airtable.app.time.monotonic", lambda: now[0])
+    client = MagicMock()
+    tables = client.base.return_value.tables
+    tables.return_value = [make_table("tblOld", "Projects")]
+    app_instance._api = client
+
+    url = app_instance._record_url("appBase", "Projects", "rec1")
+    assert url.endswith("/appBase/tblOld/rec1")
+    app_instance._get_table("appBase", "Projects")
+
+    # "Projects" is renamed and a new table takes its name.
+    tables.return_value = [
+        make_table("tblOld", "Archive"),
+        make_table("tblNew", "Projects"),
+    ]
+    now[0] += SCHEMA_CACHE_TTL
+    url = app_instance._record_url("appBase", "Projects", "rec1")
+    assert url.endswith("/appBase/tblNew/rec1")
+    app_instance._get_table("appBase", "Projects")
+    assert client.table.call_args.args == ("appBase", "tblNew")
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+def test_failed_schema_lookups_are_remembered(app_instance, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("universal_mcp_airtable.app.time.monotonic", lambda: now[0])
+    client = MagicMock()
+    tables = client.base.return_value.tables
+    app_instance._api = client
+
+    # Transient failures are not retried until the schema TTL has passed.
+    tables.side_effect = http_error(HTTPStatus.SERVICE_UNAVAILABLE)
+    assert app_instance._resolve_table_id("appBase", "Projects") == "Projects"
+    tables.side_effect = None
+    tables.return_value = [make_table("tblProjects", "Projects")]
+    assert app_instance._resolve_table_id("appBase", "Projects") == "Projects"
+    tables.assert_called_once()
+    now[0] += SCHEMA_CACHE_TTL
+    assert app_instance._resolve_table_id("appBase", "Projects") == "tblProjects"
+
+    tables.side_effect = requests.ConnectionError()
+    assert app_instance._resolve_table_id("appDown", "Projects") == "Projects"
+    tables.reset_mock()
+    assert app_instance._resolve_table_id("appDown", "Projects") == "Projects"
+    tables.assert_not_called()
+
+    # Missing schema access is remembered for good.
+    tables.side_effect = http_error(HTTPStatus.FORBIDDEN)
+    assert app_instance._resolve_table_id("appOther", "Projects") == "Projects"
+    now[0] += SCHEMA_CACHE_TTL
+    tables.reset_mock()
+    assert app_instance._resolve_table_id("appOther", "Projects") == "Projects"
+    tables.assert_not_called()
+
+
+def test_list_records_stops_fetching_at_max_records(app_instance):
+    max_records = 3
+    pages_fetched = []
+
+    def iterate(**options):
+        for page_number in range(10):
+            pages_fetched.append(page_number)
+            yield [{"id": f"rec{page_number}-{i}"} for i in range(options["page_size"])]
+
+    table = MagicMock()
+    table.iterate.side_effect = iterate
+    app_instance._get_table = MagicMock(return_value=table)
+
+    records = app_instance.list_records("appBase", "tblTable", max_records=max_records)
+
+    assert len(records) == max_records
+    assert table.iterate.call_args.kwargs["page_size"] == max_records
+    assert pages_fetched == [0]
+
+
+def test_list_records_page_size_is_clamped(app_instance):
+    page_size = 50
+    table = MagicMock()
+    table.iterate.return_value = iter([])
+    app_instance._get_table = MagicMock(return_value=table)
+
+    app_instance.list_records(
+        "appBase", "tblTable", max_records=page_size * 5, page_size=page_size
+    )
+    assert table.iterate.call_args.kwargs["page_size"] == page_size
+    assert "max_records" not in table.iterate.call_args.kwargs
+
+    # A cap of zero never starts iterating, so no page is requested at all.
+    assert app_instance.list_records("appBase", "tblTable", max_records=0) == []
+    assert table.iterate.call_count == 1
+
+def test_formula_strings_are_cached():
+    _cached_formula_str.cache_clear()
+    assert formula_to_str(Formula("{Status} = 'Done'")) == "{Status} = 'Done'"
+    assert _cached_formula_str.cache_info().currsize == 0
+
+    formulas = [
+        EQ(Field("Status"), "Done"),
+        AND(EQ(Field("Status"), "Done"), GT(Field("Count"), 1)),
+    ]
+
+    for _ in range(2):
+        for formula in formulas:
+            assert formula_to_str(formula) == to_formula_str(formula)
+    # Structurally equal formulas built anew share the cached entry too.
+    formula_to_str(EQ(Field("Status"), "Done"))
+
+    info = _cached_formula_str.cache_info()
+    assert info.misses == len(formulas)
+    assert info.hits == len(formulas) + 1
+
+def test_raw_request_keeps_airtable_error_payload(app_instance):
+    response = requests.Response()
+    response.status_code = 404
+    response._content = b'{"error": {"type": "MODEL_ID_NOT_FOUND"}}'
+    client = MagicMock()
+    client.session.request.return_value = response
+    app_instance._api = client
+
+    with pytest.raises(requests.HTTPError) as excinfo:
+        app_instance._raw_get("appBase", "tblTable", "recMissing")
+    assert "MODEL_ID_NOT_FOUND" in str(excinfo.value.args)
+
+
+def test_raw_request_returns_none_for_empty_body(app_instance):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b""
+    client = MagicMock()
+    client.session.request.return_value = response
+    app_instance._api = client
+
+    assert app_instance._raw_delete("appBase", "tblTable", "rec1") is None
+
+def test_non_idempotent_writes_are_only_retried_on_429():
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"api_key": "dummy_api_key"}
+    session = AirtableApp(integration=mock_integration)._get_client().session
+    retry = session.get_adapter("https://api.airtable.com").max_retries
+    url = "/v0/appBase/tblTable"
+
+    for method in ("POST", "PATCH"):
+        assert retry.is_retry(method, HTTPStatus.TOO_MANY_REQUESTS)
+        assert not retry.is_retry(method, HTTPStatus.BAD_GATEWAY)
+        # The request may have been applied before the connection dropped.
+        with pytest.raises(ReadTimeoutError):
+            retry.increment(method, url, error=ReadTimeoutError(None, url, "timeout"))
+
+    for method in ("GET", "DELETE"):
+        assert retry.is_retry(method, HTTPStatus.BAD_GATEWAY)
+        error = ReadTimeoutError(None, url, "timeout")
+        assert retry.increment(method, url, error=error).total == retry.total - 1
+
+
+def serve(responses):
+    """
+    Answers POSTs on localhost with `responses` (status, headers, body) in
+    turn, recording each request's method and path.
+    """
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            seen.append((self.command, self.path))
+            status, headers, body = responses.pop(0)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, seen
+
+
+def test_rate_limited_writes_are_paced_and_retried():
+    waits = []
+
+    class RecordingLimiter:
+        def wait(self, base_id):
+            waits.append(base_id)
+
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"api_key": "dummy_api_key"}
+    app = AirtableApp(integration=mock_integration)
+    app._rate_limiter = RecordingLimiter()
+    session = app._get_client().session
+    session.mount("http://", session.get_adapter("https://api.airtable.com"))
+
+    server, seen = serve([
+        (HTTPStatus.TOO_MANY_REQUESTS, {"Retry-After": "0"}, b""),
+        (HTTPStatus.OK, {"Content-Type": "application/json"}, b'{"id": "rec1"}'),
+    ])
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/v0/appBase/tblTable"
+        assert app._raw_request("POST", url) == {"id": "rec1"}
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert seen == [("POST", "/v0/appBase/tblTable")] * 2
+    assert waits == ["appBase"]
@@ -0,0 +1,172 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from universal_mcp.utils.testing import (
+    check_application_instance,
+)
+
+from universal_mcp_airtable import async_app
+from universal_mcp_airtable._http import RateLimiter
+from universal_mcp_airtable.app import AIRTABLE_API_URL, AirtableApp
+from universal_mcp_airtable.async_app import AirtableAppAsync
+
+
+@pytest.fixture
+def app_instance():
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"apiKey": "dummy_api_key"}
+    app = AirtableAppAsync(integration=mock_integration)
+    # Keep the process-wide limiter's budget out of the tests.
+    app._rate_limiter = RateLimiter()
+    return app
+
+
+def use_transport(app, handler):
+    app._client = httpx.AsyncClient(
+        base_url=AIRTABLE_API_URL, transport=httpx.MockTransport(handler)
+    )
+
+
+def test_async_application(app_instance):
+    check_application_instance(app_instance, app_name="airtable")
+    client = app_instance._get_client()
+    assert app_instance._get_client() is client
+    assert client.headers["Authorization"] == "Bearer dummy_api_key"
+    assert client.timeout.read == app_instance.default_timeout
+
+
+def test_get_record(app_instance):
+    def handler(request):
+        assert request.method == "GET"
+        assert request.url.path == "/v0/appBase/My Table/rec1"
+        assert request.url.params["cellFormat"] == "string"
+        return httpx.Response(200, json={"id": "rec1", "fields": {"Name": "a"}})
+
+    use_transport(app_instance, handler)
+    result = asyncio.run(
+        app_instance.get_record("appBase", "My Table", "rec1", cell_format="string")
+    )
+    assert result == {"id": "rec1", "fields": {"Name": "a"}}
+
+
+def test_list_records_follows_offsets(app_instance):
+    pages = {
+        None: {"records": [{"id": "rec1"}], "offset": "page2"},
+        "page2": {"records": [{"id": "rec2"}]},
+    }
+    offsets = []
+
+    def handler(request):
+        assert request.url.path == "/v0/appBase/tblTable/listRecords"
+        offset = json.loads(request.content).get("offset")
+        offsets.append(offset)
+        return httpx.Response(200, json=pages[offset])
+
+    use_transport(app_instance, handler)
+    result = asyncio.run(app_instance.list_records("appBase", "tblTable", view="Grid"))
+    assert [r["id"] for r in result] == ["rec1", "rec2"]
+    assert offsets == [None, "page2"]
+
+
+def test_batch_create_records_chunks_and_keeps_order(app_instance):
+    record_count = 25
+    chunk_sizes = []
+
+    async def handler(request):
+        records = json.loads(request.content)["records"]
+        chunk_sizes.append(len(records))
+        # Answer the first chunk last so completion order differs from input order.
+        if records[0]["fields"]["n"] == 0:
+            await asyncio.sleep(0.01)
+        return httpx.Response(
+            200, json={"records": [{"id": r["fields"]["n"]} for r in records]}
+        )
+
+    use_transport(app_instance, handler)
+    records = [{"n": i} for i in range(record_count)]
+    result = asyncio.run(
+        app_instance.batch_create_records("appBase", "tblTable", records)
+    )
+    assert [r["id"] for r in result] == list(range(record_count))
+    assert sorted(chunk_sizes) == [5, 10, 10]
+
+
+def test_batch_requests_share_the_base_rate_limit(app_instance):
+    waits = []
+
+    class RecordingLimiter:
+        async def async_wait(self, base_id):
+            waits.append(base_id)
+
+    app_instance._rate_limiter = RecordingLimiter()
+
+    def handler(request):
+        records = json.loads(request.content)["records"]
+        return httpx.Response(200, json={"records": records})
+
+    use_transport(app_instance, handler)
+    records = [{"n": i} for i in range(35)]
+    asyncio.run(app_instance.batch_create_records("appBase", "tblTable", records))
+    assert waits == ["appBase"] * 4
+
+
+def test_request_backs_off_on_429(app_instance, monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(async_app.asyncio, "sleep", fake_sleep)
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(429),
+        httpx.Response(200, json={"id": "rec1"}),
+    ]
+    use_transport(app_instance, lambda request: responses.pop(0))
+
+    result = asyncio.run(app_instance.get_record("appBase", "tblTable", "rec1"))
+    assert result == {"id": "rec1"}
+    assert delays == [3.0, 1.0]
+
+
+def test_request_returns_error_after_retries(app_instance, monkeypatch):
+    async def fake_sleep(delay):
+        pass
+
+    monkeypatch.setattr(async_app.asyncio, "sleep", fake_sleep)
+    use_transport(app_instance, lambda request: httpx.Response(429))
+
+    result = asyncio.run(app_instance.get_record("appBase", "tblTable", "rec1"))
+    assert result["error"]["kind"] == "rate_limited"
+
+
+def test_aclose_closes_client(app_instance):
+    client = app_instance._get_client()
+    asyncio.run(app_instance.aclose())
+    assert client.is_closed
+    assert app_instance._client is None
+    assert app_instance._get_client() is not client
+
+
+def test_tools_share_sync_docstrings(app_instance):
+    assert app_instance.get_record.__doc__ == AirtableApp.get_record.__doc__
+    assert "Tags:" in app_instance.batch_upsert_records.__doc__
+
+
+def test_error_payload_is_kept(app_instance):
+    def handler(request):
+        return httpx.Response(404, json={"error": {"type": "MODEL_ID_NOT_FOUND"}})
+
+    use_transport(app_instance, handler)
+    result = asyncio.run(app_instance.get_record("appBase", "tblTable", "recMissing"))
+    assert result["error"]["kind"] == "not_found"
+    assert "MODEL_ID_NOT_FOUND" in result["error"]["message"]
+
+
+def test_empty_body_returns_none(app_instance):
+    use_transport(app_instance, lambda request: httpx.Response(200))
+    result = asyncio.run(app_instance.delete_record("appBase", "tblTable", "rec1"))
+    assert result is None
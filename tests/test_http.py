@@ -0,0 +1,45 @@
+import pytest
+
+from universal_mcp_airtable._http import (
+    REQUESTS_PER_SECOND,
+    RateLimiter,
+    base_id_from_path,
+    chunked,
+)
+
+
+def test_chunked_splits_into_batch_sized_lists():
+    assert list(chunked(range(25))) == [
+        list(range(10)),
+        list(range(10, 20)),
+        list(range(20, 25)),
+    ]
+    assert list(chunked(iter([]))) == []
+
+
+def test_base_id_from_path():
+    assert base_id_from_path("/v0/appBase/tblTable/rec1") == "appBase"
+    assert base_id_from_path("/meta/bases/appBase/tables") == "appBase"
+    assert base_id_from_path("/v0/meta/bases") is None
+
+
+def test_rate_limiter_paces_each_base(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("universal_mcp_airtable._http.time.monotonic", lambda: now[0])
+    limiter = RateLimiter()
+    interval = 1 / REQUESTS_PER_SECOND
+
+    # A full bucket lets a burst through, then requests are queued one
+    # interval apart.
+    delays = [limiter.reserve("appBase") for _ in range(REQUESTS_PER_SECOND + 2)]
+    assert delays[:REQUESTS_PER_SECOND] == [0.0] * REQUESTS_PER_SECOND
+    assert delays[REQUESTS_PER_SECOND:] == pytest.approx([interval, 2 * interval])
+
+    # Other bases have their own budget.
+    assert limiter.reserve("appOther") == 0.0
+
+    # The bucket refills over time, up to its capacity.
+    now[0] += 10
+    delays = [limiter.reserve("appBase") for _ in range(REQUESTS_PER_SECOND + 1)]
+    assert delays[-1] == pytest.approx(interval)
+    assert not any(delays[:-1])
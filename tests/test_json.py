@@ -0,0 +1,47 @@
+import json
+
+import orjson
+import pytest
+import requests
+from requests.hooks import dispatch_hook
+
+from universal_mcp_airtable._json import install_orjson
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    install_orjson(session)
+    return session
+
+
+def test_json_body_is_encoded_with_orjson(session):
+    payload = {"records": [{"fields": {"Name": "é"}}]}
+    prepared = session.prepare_request(
+        requests.Request("POST", "https://api.airtable.com/v0/app/tbl", json=payload)
+    )
+    assert prepared.body == orjson.dumps(payload)
+    assert prepared.headers["Content-Type"] == "application/json"
+
+
+def test_unencodable_body_falls_back_to_requests(session):
+    # orjson only handles 64-bit integers; the stdlib encoder does not care.
+    payload = {"n": 2**70}
+    prepared = session.prepare_request(
+        requests.Request("POST", "https://api.airtable.com/v0/app/tbl", json=payload)
+    )
+    assert json.loads(prepared.body) == payload
+    assert prepared.headers["Content-Type"] == "application/json"
+
+
+def test_response_json_is_decoded_with_orjson(session):
+    response = requests.Response()
+    response._content = b'{"id": "rec1"}'
+    response = dispatch_hook("response", session.hooks, response)
+    assert response.json() == {"id": "rec1"}
+
+    response = requests.Response()
+    response._content = b"<html>Bad Gateway</html>"
+    response = dispatch_hook("response", session.hooks, response)
+    with pytest.raises(json.JSONDecodeError):
+        response.json()